@@ -7,37 +7,64 @@ import argparse
 import logging
 import getpass
 import typing as typ
-from fishy.wrapper.bad_cluster import BadClusterWrapper
-from fishy.wrapper.cluster_allocation import ClusterAllocation
-from fishy.fat.fat_filesystem.fat_wrapper import create_fat
-from fishy.fat.fat_filesystem.fattools import FATtools
-from fishy.wrapper.file_slack import FileSlack
-from fishy.metadata import Metadata
-from fishy.wrapper.mft_slack import MftSlack
-from fishy.wrapper.osd2 import OSD2
-from fishy.wrapper.obso_faddr import FADDR
-from fishy.wrapper.reserved_gdt_blocks import ReservedGDTBlocks
-from fishy.wrapper.superblock_slack import SuperblockSlack
-from fishy.wrapper.inode_padding import inodePadding
-from fishy.wrapper.write_gen import write_gen
-from fishy.wrapper.timestamp_hiding import timestampHiding
-from fishy.wrapper.xfield_padding import xfieldPadding
+
+# the hiding technique implementations are imported lazily inside their
+# subcommand handlers, so a CLI invocation only pays the import cost of
+# the technique it actually uses
 
 
 LOGGER = logging.getLogger("cli")
 
+# build_parser result, built once per process
+_PARSER = None
+
+
+def _create_metadata(args: argparse.Namespace) -> 'Metadata':
+    """
+    create a Metadata instance, asking for a password if the user
+    requested encryption
+    :param args: argparse.Namespace
+    :return: Metadata
+    """
+    from fishy.metadata import Metadata
+    if args.password is False:
+        return Metadata()
+    print("Please enter password: ")
+    pw = getpass.getpass()
+    return Metadata(password=pw)
+
+
+def _read_metadata(args: argparse.Namespace) -> 'Metadata':
+    """
+    read the metadata file given on the command line
+    :param args: argparse.Namespace
+    :return: Metadata
+    :raises: IOError, if no metadata file was supplied
+    """
+    if not args.metadata:
+        raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
+    with open(args.metadata, 'rb') as metadata_file:
+        meta = _create_metadata(args)
+        meta.read(metadata_file)
+    return meta
+
+
+def _require_metadata(args: argparse.Namespace) -> None:
+    """
+    ensure that a metadata file was supplied, without reading it
+    :param args: argparse.Namespace
+    :raises: IOError, if no metadata file was supplied
+    """
+    if not args.metadata:
+        raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
+
 
 def do_metadata(args: argparse.Namespace) -> None:
     """
     handles metadata subcommand execution
     :param args: argparse.Namespace
     """
-    if args.password is False:
-        meta = Metadata()
-    else:
-        print("Please enter password: ")
-        pw = getpass.getpass()
-        meta = Metadata(password=pw)
+    meta = _create_metadata(args)
     meta.read(args.metadata)
     meta.info()
 
@@ -48,6 +75,8 @@ def do_fattools(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.fat.fat_filesystem.fat_wrapper import create_fat
+    from fishy.fat.fat_filesystem.fattools import FATtools
     fattool = FATtools(create_fat(device))
     if args.fat:
         fattool.list_fat()
@@ -63,18 +92,14 @@ def do_fileslack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.file_slack import FileSlack
     if args.info:
         slacker = FileSlack(device, Metadata(), args.dev)
         slacker.info(args.destination)
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            slacker = FileSlack(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            slacker = FileSlack(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        slacker = FileSlack(device, _create_metadata(args), args.dev)
         if not args.file:
             # write from stdin into fileslack
             slacker.write(sys.stdin.buffer, args.destination)
@@ -85,47 +110,17 @@ def do_fileslack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             slacker.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read file slack of a single hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = FileSlack(device, meta, args.dev)
-            slacker.read(sys.stdout.buffer)
+        slacker = FileSlack(device, _read_metadata(args), args.dev)
+        slacker.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden data in fileslack into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = FileSlack(device, meta, args.dev)
-            slacker.read_into_file(args.outfile)
+        slacker = FileSlack(device, _read_metadata(args), args.dev)
+        slacker.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear fileslack
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = FileSlack(device, meta, args.dev)
-            slacker.clear()
+        slacker = FileSlack(device, _read_metadata(args), args.dev)
+        slacker.clear()
 
 
 def do_mftslack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
@@ -134,18 +129,15 @@ def do_mftslack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.mft_slack import MftSlack
     if args.info:
         slacker = MftSlack(device, Metadata(), args.dev)
         slacker.info(args.offset, args.limit)
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            slacker = MftSlack(device, Metadata(), args.dev, args.domirr)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            slacker = MftSlack(device, Metadata(password=pw), args.dev, args.domirr)
+        _require_metadata(args)
+        slacker = MftSlack(device, _create_metadata(args), args.dev,
+                           args.domirr)
         if not args.file:
             # write from stdin into mftslack
             slacker.write(sys.stdin.buffer, offset=args.offset)
@@ -156,47 +148,17 @@ def do_mftslack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             slacker.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read file slack of a single hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = MftSlack(device, meta, args.dev)
-            slacker.read(sys.stdout.buffer)
+        slacker = MftSlack(device, _read_metadata(args), args.dev)
+        slacker.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden data in fileslack into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = MftSlack(device, meta, args.dev)
-            slacker.read_into_file(args.outfile)
+        slacker = MftSlack(device, _read_metadata(args), args.dev)
+        slacker.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear fileslack
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slacker = MftSlack(device, meta, args.dev)
-            slacker.clear()
+        slacker = MftSlack(device, _read_metadata(args), args.dev)
+        slacker.clear()
 
 
 def do_addcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
@@ -205,15 +167,11 @@ def do_addcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.wrapper.cluster_allocation import ClusterAllocation
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            allocator = ClusterAllocation(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            allocator = ClusterAllocation(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        allocator = ClusterAllocation(device, _create_metadata(args),
+                                      args.dev)
         if not args.file:
             # write from stdin into additional clusters
             allocator.write(sys.stdin.buffer, args.destination)
@@ -224,47 +182,17 @@ def do_addcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             allocator.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read file slack of a single hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = ClusterAllocation(device, meta, args.dev)
-            allocator.read(sys.stdout.buffer)
+        allocator = ClusterAllocation(device, _read_metadata(args), args.dev)
+        allocator.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden data from additional clusters into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = ClusterAllocation(device, meta, args.dev)
-            allocator.read_into_file(args.outfile)
+        allocator = ClusterAllocation(device, _read_metadata(args), args.dev)
+        allocator.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear additional clusters
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = ClusterAllocation(device, meta, args.dev)
-            allocator.clear()
+        allocator = ClusterAllocation(device, _read_metadata(args), args.dev)
+        allocator.clear()
 
 def do_badcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     """
@@ -272,15 +200,11 @@ def do_badcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.wrapper.bad_cluster import BadClusterWrapper
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            allocator = BadClusterWrapper(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            allocator = BadClusterWrapper(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        allocator = BadClusterWrapper(device, _create_metadata(args),
+                                      args.dev)
         if not args.file:
             # write from stdin into bad clusters
             allocator.write(sys.stdin.buffer)
@@ -291,47 +215,17 @@ def do_badcluster(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             allocator.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read bad cluster to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = BadClusterWrapper(device, meta, args.dev)
-            allocator.read(sys.stdout.buffer)
+        allocator = BadClusterWrapper(device, _read_metadata(args), args.dev)
+        allocator.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden data from bad cluster into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = BadClusterWrapper(device, meta, args.dev)
-            allocator.read_into_file(args.outfile)
+        allocator = BadClusterWrapper(device, _read_metadata(args), args.dev)
+        allocator.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear bad cluster
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            allocator = BadClusterWrapper(device, meta, args.dev)
-            allocator.clear()
+        allocator = BadClusterWrapper(device, _read_metadata(args), args.dev)
+        allocator.clear()
 
 
 def do_reserved_gdt_blocks(args: argparse.Namespace, device: typ.BinaryIO) -> None:
@@ -340,15 +234,11 @@ def do_reserved_gdt_blocks(args: argparse.Namespace, device: typ.BinaryIO) -> No
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.reserved_gdt_blocks import ReservedGDTBlocks
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            reserve = ReservedGDTBlocks(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            reserve = ReservedGDTBlocks(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        reserve = ReservedGDTBlocks(device, _create_metadata(args), args.dev)
         if not args.file:
             # write from stdin into reserved GDT blocks
             reserve.write(sys.stdin.buffer)
@@ -359,63 +249,25 @@ def do_reserved_gdt_blocks(args: argparse.Namespace, device: typ.BinaryIO) -> No
         with open(args.metadata, 'wb+') as metadata_out:
             reserve.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            reserve = ReservedGDTBlocks(device, meta, args.dev)
-            reserve.read(sys.stdout.buffer)
+        reserve = ReservedGDTBlocks(device, _read_metadata(args), args.dev)
+        reserve.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            reserve = ReservedGDTBlocks(device, meta, args.dev)
-            reserve.read_into_file(args.outfile)
+        reserve = ReservedGDTBlocks(device, _read_metadata(args), args.dev)
+        reserve.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear reserved GDT blocks
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            reserve = ReservedGDTBlocks(device, meta, args.dev)
-            reserve.clear()
+        reserve = ReservedGDTBlocks(device, _read_metadata(args), args.dev)
+        reserve.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                reserve = ReservedGDTBlocks(device, meta, args.dev)
-                reserve.info()
+            reserve = ReservedGDTBlocks(device, _read_metadata(args),
+                                        args.dev)
         else:
-                reserve = ReservedGDTBlocks(device, Metadata(), args.dev)
-                reserve.info()
+            reserve = ReservedGDTBlocks(device, Metadata(), args.dev)
+        reserve.info()
 
 
 def do_superblock_slack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
@@ -424,15 +276,11 @@ def do_superblock_slack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.superblock_slack import SuperblockSlack
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            slack = SuperblockSlack(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            slack = SuperblockSlack(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        slack = SuperblockSlack(device, _create_metadata(args), args.dev)
         if not args.file:
             # write from stdin into superblock slack
             slack.write(sys.stdin.buffer)
@@ -443,63 +291,24 @@ def do_superblock_slack(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             slack.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slack = SuperblockSlack(device, meta, args.dev)
-            slack.read(sys.stdout.buffer)
+        slack = SuperblockSlack(device, _read_metadata(args), args.dev)
+        slack.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slack = SuperblockSlack(device, meta, args.dev)
-            slack.read_into_file(args.outfile)
+        slack = SuperblockSlack(device, _read_metadata(args), args.dev)
+        slack.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear superblock slack
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            slack = SuperblockSlack(device, meta, args.dev)
-            slack.clear()
+        slack = SuperblockSlack(device, _read_metadata(args), args.dev)
+        slack.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                slack = SuperblockSlack(device, meta, args.dev)
-                slack.info()
+            slack = SuperblockSlack(device, _read_metadata(args), args.dev)
         else:
-                slack = SuperblockSlack(device, Metadata(), args.dev)
-                slack.info()            
+            slack = SuperblockSlack(device, Metadata(), args.dev)
+        slack.info()
 
 def do_osd2(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     """
@@ -507,15 +316,11 @@ def do_osd2(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.osd2 import OSD2
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            osd2 = OSD2(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            osd2 = OSD2(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        osd2 = OSD2(device, _create_metadata(args), args.dev)
         if not args.file:
             # write from stdin into osd2 fields
             osd2.write(sys.stdin.buffer)
@@ -526,63 +331,24 @@ def do_osd2(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             osd2.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            osd2 = OSD2(device, meta, args.dev)
-            osd2.read(sys.stdout.buffer)
+        osd2 = OSD2(device, _read_metadata(args), args.dev)
+        osd2.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            osd2 = OSD2(device, meta, args.dev)
-            osd2.read_into_file(args.outfile)
+        osd2 = OSD2(device, _read_metadata(args), args.dev)
+        osd2.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear osd2 fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            osd2 = OSD2(device, meta, args.dev)
-            osd2.clear()
+        osd2 = OSD2(device, _read_metadata(args), args.dev)
+        osd2.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                osd2 = OSD2(device, meta, args.dev)
-                osd2.info()
+            osd2 = OSD2(device, _read_metadata(args), args.dev)
         else:
-                osd2 = OSD2(device, Metadata(), args.dev)
-                osd2.info()
+            osd2 = OSD2(device, Metadata(), args.dev)
+        osd2.info()
 
 def do_obso_faddr(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     """
@@ -590,15 +356,11 @@ def do_obso_faddr(args: argparse.Namespace, device: typ.BinaryIO) -> None:
     :param args: argparse.Namespace
     :param device: stream of the filesystem
     """
+    from fishy.metadata import Metadata
+    from fishy.wrapper.obso_faddr import FADDR
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            faddr = FADDR(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            faddr = FADDR(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        faddr = FADDR(device, _create_metadata(args), args.dev)
         if not args.file:
             # write from stdin into faddr fields
             faddr.write(sys.stdin.buffer)
@@ -609,75 +371,31 @@ def do_obso_faddr(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             faddr.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            faddr = FADDR(device, meta, args.dev)
-            faddr.read(sys.stdout.buffer)
+        faddr = FADDR(device, _read_metadata(args), args.dev)
+        faddr.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            faddr = FADDR(device, meta, args.dev)
-            faddr.read_into_file(args.outfile)
+        faddr = FADDR(device, _read_metadata(args), args.dev)
+        faddr.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # clear faddr fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            faddr = FADDR(device, meta, args.dev)
-            faddr.clear()
+        faddr = FADDR(device, _read_metadata(args), args.dev)
+        faddr.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                faddr = FADDR(device, meta, args.dev)
-                faddr.info()
+            faddr = FADDR(device, _read_metadata(args), args.dev)
         else:
-                faddr = FADDR(device, Metadata(), args.dev)
-                faddr.info()
+            faddr = FADDR(device, Metadata(), args.dev)
+        faddr.info()
 			
 def do_inode_padding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
-    
+    from fishy.metadata import Metadata
+    from fishy.wrapper.inode_padding import inodePadding
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            ipad = inodePadding(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            ipad = inodePadding(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        ipad = inodePadding(device, _create_metadata(args), args.dev)
         if not args.file:
             ipad.write(sys.stdin.buffer)
         else:
@@ -686,75 +404,31 @@ def do_inode_padding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             ipad.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            ipad = inodePadding(device, meta, args.dev)
-            ipad.read(sys.stdout.buffer)
+        ipad = inodePadding(device, _read_metadata(args), args.dev)
+        ipad.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            ipad = inodePadding(device, meta, args.dev)
-            ipad.read_into_file(args.outfile)
+        ipad = inodePadding(device, _read_metadata(args), args.dev)
+        ipad.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        # clear faddr fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            ipad = inodePadding(device, meta, args.dev)
-            ipad.clear()
+        # clear padding fields
+        ipad = inodePadding(device, _read_metadata(args), args.dev)
+        ipad.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                ipad = inodePadding(device, meta, args.dev)
-                ipad.info()
+            ipad = inodePadding(device, _read_metadata(args), args.dev)
         else:
-                ipad = inodePadding(device, Metadata(), args.dev)
-                ipad.info()
+            ipad = inodePadding(device, Metadata(), args.dev)
+        ipad.info()
 
 def do_write_gen(args: argparse.Namespace, device: typ.BinaryIO) -> None:
-    
+    from fishy.metadata import Metadata
+    from fishy.wrapper.write_gen import write_gen
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            wgen = write_gen(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            wgen = write_gen(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        wgen = write_gen(device, _create_metadata(args), args.dev)
         if not args.file:
             wgen.write(sys.stdin.buffer)
         else:
@@ -763,75 +437,31 @@ def do_write_gen(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             wgen.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            wgen = write_gen(device, meta, args.dev)
-            wgen.read(sys.stdout.buffer)
+        wgen = write_gen(device, _read_metadata(args), args.dev)
+        wgen.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password = pw)
-            meta.read(metadata_file)
-            wgen = write_gen(device, meta, args.dev)
-            wgen.read_into_file(args.outfile)
+        wgen = write_gen(device, _read_metadata(args), args.dev)
+        wgen.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        # clear faddr fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            wgen = write_gen(device, meta, args.dev)
-            wgen.clear()
+        # clear write_gen fields
+        wgen = write_gen(device, _read_metadata(args), args.dev)
+        wgen.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                wgen = write_gen(device, meta, args.dev)
-                wgen.info()
+            wgen = write_gen(device, _read_metadata(args), args.dev)
         else:
-                wgen = write_gen(device, Metadata(), args.dev)
-                wgen.info()
+            wgen = write_gen(device, Metadata(), args.dev)
+        wgen.info()
 
 def do_timestamp_hiding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
-    
+    from fishy.metadata import Metadata
+    from fishy.wrapper.timestamp_hiding import timestampHiding
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            timestamp = timestampHiding(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            timestamp = timestampHiding(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        timestamp = timestampHiding(device, _create_metadata(args), args.dev)
         if not args.file:
             timestamp.write(sys.stdin.buffer)
         else:
@@ -840,75 +470,32 @@ def do_timestamp_hiding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             timestamp.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            timestamp = timestampHiding(device, meta, args.dev)
-            timestamp.read(sys.stdout.buffer)
+        timestamp = timestampHiding(device, _read_metadata(args), args.dev)
+        timestamp.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            timestamp = timestampHiding(device, meta, args.dev)
-            timestamp.read_into_file(args.outfile)
+        timestamp = timestampHiding(device, _read_metadata(args), args.dev)
+        timestamp.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        # clear faddr fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            timestamp = timestampHiding(device, meta, args.dev)
-            timestamp.clear()
+        # clear timestamps
+        timestamp = timestampHiding(device, _read_metadata(args), args.dev)
+        timestamp.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                timestamp = timestampHiding(device, meta, args.dev)
-                timestamp.info()
+            timestamp = timestampHiding(device, _read_metadata(args),
+                                        args.dev)
         else:
-                timestamp = timestampHiding(device, Metadata(), args.dev)
-                timestamp.info()   
+            timestamp = timestampHiding(device, Metadata(), args.dev)
+        timestamp.info()
 
 def do_xfield_padding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
-    
+    from fishy.metadata import Metadata
+    from fishy.wrapper.xfield_padding import xfieldPadding
     if args.write:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        if args.password is False:
-            xfield = xfieldPadding(device, Metadata(), args.dev)
-        else:
-            print("Please enter password: ")
-            pw = getpass.getpass()
-            xfield = xfieldPadding(device, Metadata(password=pw), args.dev)
+        _require_metadata(args)
+        xfield = xfieldPadding(device, _create_metadata(args), args.dev)
         if not args.file:
             xfield.write(sys.stdin.buffer)
         else:
@@ -917,63 +504,24 @@ def do_xfield_padding(args: argparse.Namespace, device: typ.BinaryIO) -> None:
         with open(args.metadata, 'wb+') as metadata_out:
             xfield.metadata.write(metadata_out)
     elif args.read:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file to stdout
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            xfield = xfieldPadding(device, meta, args.dev)
-            xfield.read(sys.stdout.buffer)
+        xfield = xfieldPadding(device, _read_metadata(args), args.dev)
+        xfield.read(sys.stdout.buffer)
     elif args.outfile:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
         # read hidden file into outfile
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            xfield = xfieldPadding(device, meta, args.dev)
-            xfield.read_into_file(args.outfile)
+        xfield = xfieldPadding(device, _read_metadata(args), args.dev)
+        xfield.read_into_file(args.outfile)
     elif args.clear:
-        if not args.metadata:
-            raise IOError("This method requires a metadata file. Please add -m [name of file] to the command.")
-        # clear faddr fields
-        with open(args.metadata, 'rb') as metadata_file:
-            if args.password is False:
-                meta = Metadata()
-            else:
-                print("Please enter password: ")
-                pw = getpass.getpass()
-                meta = Metadata(password=pw)
-            meta.read(metadata_file)
-            xfield = xfieldPadding(device, meta, args.dev)
-            xfield.clear()
+        # clear extended fields
+        xfield = xfieldPadding(device, _read_metadata(args), args.dev)
+        xfield.clear()
     elif args.info:
         # show info
         if args.metadata:
-            with open(args.metadata, 'rb') as metadata_file:
-                if args.password is False:
-                    meta = Metadata()
-                else:
-                    print("Please enter password: ")
-                    pw = getpass.getpass()
-                    meta = Metadata(password=pw)
-                meta.read(metadata_file)
-                xfield = xfieldPadding(device, meta, args.dev)
-                xfield.info()
+            xfield = xfieldPadding(device, _read_metadata(args), args.dev)
         else:
-                xfield = xfieldPadding(device, Metadata(), args.dev)
-                xfield.info()
+            xfield = xfieldPadding(device, Metadata(), args.dev)
+        xfield.info()
 
 			
 			
@@ -982,8 +530,14 @@ def build_parser() -> argparse.ArgumentParser:
     """
     Get the cli parser
 
+    the parser is only built on the first call, repeated calls within
+    one process get the cached instance
+
     :rtype: argparse.ArgumentParser
     """
+    global _PARSER  # pylint: disable=global-statement
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(description='Toolkit for filesystem based data hiding techniques.')
     # TODO: Maybe this option should be required for hiding technique
     #       subcommand but not for metadata.... needs more thoughs than I
@@ -1143,9 +697,10 @@ def build_parser() -> argparse.ArgumentParser:
     xfield.add_argument('-c', '--clear', dest='clear', action='store_true', help='clear extended fields')
     xfield.add_argument('-i', '--info', dest='info', action='store_true', help='show information about xfield padding')
     xfield.add_argument('file', metavar='FILE', nargs='?', help="File to write into extended fields, if nothing provided, use stdin")
-	
-	
 
+
+
+    _PARSER = parser
     return parser
 
 
@@ -23,7 +23,6 @@ delete bad clusters for a file:
 
 import logging
 import typing as typ
-from io import BytesIO, BufferedReader
 from .fat_filesystem.fat import NoFreeClusterAvailableError
 from .fat_filesystem.fat_32 import FAT32
 from .fat_filesystem.fat_detector import get_filesystem_type
@@ -104,8 +103,15 @@ class BadCluster:
         # get last cluster of the file we want to use
         cluster_count = 0
         written_length = 0
-        LOGGER.info("%d Bytes in buffer to write", len(instream.peek()))
-        while instream.peek():
+        # calculate size of a cluster
+        cluster_size = self.fatfs.pre.sector_size \
+                       * self.fatfs.pre.sectors_per_cluster
+        # read ahead one cluster instead of peeking; peek forces a
+        # buffered read per iteration and only reports what happens to
+        # sit in the buffer
+        bufferv = instream.read(cluster_size)
+        LOGGER.info("%d Bytes in buffer to write", len(bufferv))
+        while bufferv:
             try:
                 # get next cluster to write into
                 next_cluster = self.fatfs.get_free_cluster()
@@ -120,7 +126,7 @@ class BadCluster:
             # record this cluster to metadata
             metadata.add_cluster(next_cluster)
             # write to cluster
-            written_bytes = self._write_to_cluster(instream, next_cluster)
+            written_bytes = self._write_to_cluster(bufferv, next_cluster)
             written_length += written_bytes
             LOGGER.info("%d bytes written into cluster %d",
                         written_bytes, next_cluster)
@@ -128,6 +134,7 @@ class BadCluster:
             metadata.set_length(written_length)
             # save last cluster
             last_cluster = next_cluster
+            bufferv = instream.read(cluster_size)
         # clean up fs_info sector, if we write to FAT32
         if isinstance(self.fatfs, FAT32):
             self.fatfs.write_last_allocated(last_cluster)
@@ -136,20 +143,14 @@ class BadCluster:
             self.fatfs.write_last_allocated(new_free_clusters)
         return metadata
 
-    def _write_to_cluster(self, instream: typ.BinaryIO, cluster_id) \
+    def _write_to_cluster(self, bufferv: bytes, cluster_id) \
             -> int:
         """
-        writes from instream into cluster
-        :param instream: stream to read from
+        writes a buffer into cluster
+        :param bufferv: bytes, at most one cluster worth of data
         :param cluster_id: id of the cluster the data gets written into
-        :return: tuple of (number of bytes written, cluster_id written to)
+        :return: int, number of bytes written
         """
-        cluster_size = self.fatfs.pre.sector_size \
-                       * self.fatfs.pre.sectors_per_cluster
-        # read what to write. ensure that we only read the amount of data,
-        # that fits into cluster
-        bufferv = instream.read(cluster_size)
-        LOGGER.info("%d bytes read from instream", len(bufferv))
         # find position where we can start writing data
         cluster_start = self.fatfs.get_cluster_start(cluster_id)
         self.stream.seek(cluster_start)
@@ -192,14 +193,11 @@ class BadCluster:
                        * self.fatfs.pre.sectors_per_cluster
         # get metadata
         clusters = metadata.get_clusters()
-        # prepare stream with zero bytes to overwrite clusters
-        mem = BytesIO()
-        mem.write(cluster_size * b'\x00')
-        reader = BufferedReader(mem)
+        # prepare zero bytes to overwrite clusters
+        zeroes = cluster_size * b'\x00'
         for cluster_id in clusters:
             # overwrite cluster
-            mem.seek(0)
-            self._write_to_cluster(reader, cluster_id)
+            self._write_to_cluster(zeroes, cluster_id)
             # unlink cluster
             self.fatfs.write_fat_entry(cluster_id, 'free_cluster')
         if isinstance(self.fatfs, FAT32):
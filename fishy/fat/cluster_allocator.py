@@ -24,7 +24,6 @@ delete additional allocated clusters for a file:
 
 import logging
 import typing as typ
-from io import BytesIO, BufferedReader
 from .fat_filesystem.fat import NoFreeClusterAvailableError
 from .fat_filesystem.fat_32 import FAT32
 from .fat_filesystem.fat_detector import get_filesystem_type
@@ -137,8 +136,15 @@ class ClusterAllocator:
                     last_cluster)
         cluster_count = 0
         written_length = 0
-        LOGGER.info("%d Bytes in buffer to write", len(instream.peek()))
-        while instream.peek():
+        # calculate size of a cluster
+        cluster_size = self.fatfs.pre.sector_size \
+                       * self.fatfs.pre.sectors_per_cluster
+        # read ahead one cluster instead of peeking; peek forces a
+        # buffered read per iteration and only reports what happens to
+        # sit in the buffer
+        bufferv = instream.read(cluster_size)
+        LOGGER.info("%d Bytes in buffer to write", len(bufferv))
+        while bufferv:
             try:
                 # get next cluster to write into
                 next_cluster = self.fatfs.get_free_cluster()
@@ -156,13 +162,14 @@ class ClusterAllocator:
             if metadata.get_start_cluster() is None:
                 metadata.set_start_cluster(next_cluster)
             # write to cluster
-            written_bytes = self._write_to_cluster(instream, next_cluster)
+            written_bytes = self._write_to_cluster(bufferv, next_cluster)
             written_length += written_bytes
             LOGGER.info("%d bytes written into cluster %d",
                         written_bytes, next_cluster)
             last_cluster = next_cluster
             # write overall length into metadata
             metadata.set_length(written_length)
+            bufferv = instream.read(cluster_size)
         # finish fat chain
         LOGGER.info("Finishing cluster chain on cluster %d", last_cluster)
         self.fatfs.write_fat_entry(last_cluster, 'last_cluster')
@@ -174,20 +181,14 @@ class ClusterAllocator:
             self.fatfs.write_last_allocated(new_free_clusters)
         return metadata
 
-    def _write_to_cluster(self, instream: typ.BinaryIO, cluster_id) \
+    def _write_to_cluster(self, bufferv: bytes, cluster_id) \
             -> int:
         """
-        writes from instream into cluster
-        :param instream: stream to read from
+        writes a buffer into cluster
+        :param bufferv: bytes, at most one cluster worth of data
         :param cluster_id: id of the cluster the data gets written into
-        :return: tuple of (number of bytes written, cluster_id written to)
+        :return: int, number of bytes written
         """
-        cluster_size = self.fatfs.pre.sector_size \
-                       * self.fatfs.pre.sectors_per_cluster
-        # read what to write. ensure that we only read the amount of data,
-        # that fits into cluster
-        bufferv = instream.read(cluster_size)
-        LOGGER.info("%d bytes read from instream", len(bufferv))
         # find position where we can start writing data
         cluster_start = self.fatfs.get_cluster_start(cluster_id)
         self.stream.seek(cluster_start)
@@ -239,14 +240,11 @@ class ClusterAllocator:
         clusters = self.fatfs.follow_cluster(start_cluster)
         # set original last cluster for file
         self.fatfs.write_fat_entry(orig_last_cluster, 'last_cluster')
-        # prepare stream with zero bytes to overwrite clusters
-        mem = BytesIO()
-        mem.write(cluster_size * b'\x00')
-        reader = BufferedReader(mem)
+        # prepare zero bytes to overwrite clusters
+        zeroes = cluster_size * b'\x00'
         for cluster_id in clusters:
             # overwrite cluster
-            mem.seek(0)
-            self._write_to_cluster(reader, cluster_id)
+            self._write_to_cluster(zeroes, cluster_id)
             # unlink cluster
             self.fatfs.write_fat_entry(cluster_id, 'free_cluster')
         if isinstance(self.fatfs, FAT32):
@@ -3,7 +3,9 @@ Directory and Long Filename entries that appear in root and
 subdirectories.
 """
 
+import struct
 import typing as typ
+from collections import namedtuple
 from construct import Struct, Byte, Bytes, BitStruct, Flag, Padding, \
                       Int16ul, Int32ul, Int8ul
 
@@ -55,6 +57,43 @@ LFN_ENTRY_DEFINITION = Struct(
     "name3" / Bytes(4),
     )
 
+# precompiled struct versions of the above definitions. construct runs
+# a python state machine and allocates a Container per parsed entry,
+# which adds up when iterating whole directories, so the actual parsing
+# is done with these and the results are wrapped into namedtuples that
+# expose the same field names
+# accessRightsBitmap (reused as the high cluster word on FAT32) and
+# firstCluster are decoded as integers, as get_start_cluster only ever
+# combines them numerically
+DIR_ENTRY_STRUCT = struct.Struct('<8s3sBxB6xHHHHI')
+LFN_ENTRY_STRUCT = struct.Struct('<B10sBBB12s2s4s')
+
+AttributeFlags = namedtuple('AttributeFlags',
+                            ['unused', 'device', 'archive', 'subDirectory',
+                             'volumeLabel', 'system', 'hidden', 'readonly'])
+ParsedDirEntry = namedtuple('ParsedDirEntry',
+                            ['name', 'extension', 'attributes',
+                             'deleted_char', 'accessRightsBitmap',
+                             'timeRecorded', 'dateRecorded', 'firstCluster',
+                             'fileSize'])
+ParsedLfnEntry = namedtuple('ParsedLfnEntry',
+                            ['sequence_number', 'name1', 'attributes',
+                             'type', 'checksum', 'name2', 'first_cluster',
+                             'name3'])
+
+
+def _parse_attributes(value: int) -> AttributeFlags:
+    """
+    parse the attribute byte of a directory entry into boolean flags
+
+    :param value: int, attribute byte of a directory entry
+    :rtype: AttributeFlags
+    """
+    return AttributeFlags(bool(value & 0x80), bool(value & 0x40),
+                          bool(value & 0x20), bool(value & 0x10),
+                          bool(value & 0x08), bool(value & 0x04),
+                          bool(value & 0x02), bool(value & 0x01))
+
 
 class LFNEntries(list):
     """
@@ -69,10 +108,7 @@ class LFNEntries(list):
         # if not len(self):
         #     return None
         sorted_entries = sorted(self, key=lambda x: x.get_sequence_number())
-        name = ""
-        for entry in sorted_entries:
-            name += entry.get_name()
-        return name
+        return "".join(entry.get_name() for entry in sorted_entries)
 
 
 class DirEntry(object):
@@ -88,9 +124,20 @@ class DirEntry(object):
         """
         self.is_fat32 = fat_type == 'FAT32'
         self.byte_representation = byte_representation
-        self.parsed = DIR_ENTRY_DEFINITION.parse(byte_representation)
-        if self.is_lfn():
-            self.parsed = LFN_ENTRY_DEFINITION.parse(byte_representation)
+        # the attribute byte sits at offset 11 for both entry types and
+        # decides which layout applies; per FAT spec an entry is a long
+        # filename entry iff the lower four attribute bits are all set
+        attribute_byte = byte_representation[11]
+        self._is_lfn = attribute_byte & 0x0f == 0x0f
+        attributes = _parse_attributes(attribute_byte)
+        if self._is_lfn:
+            fields = LFN_ENTRY_STRUCT.unpack(byte_representation)
+            self.parsed = ParsedLfnEntry(fields[0], fields[1], attributes,
+                                         *fields[3:])
+        else:
+            fields = DIR_ENTRY_STRUCT.unpack(byte_representation)
+            self.parsed = ParsedDirEntry(fields[0], fields[1], attributes,
+                                         *fields[3:])
         self.lfn_name = None
 
     def get_sequence_number(self) -> int:
@@ -116,10 +163,7 @@ class DirEntry(object):
         checks if this entry is a long filename entry
         :rtype: bool
         """
-        return self.parsed.attributes.volumeLabel \
-                and self.parsed.attributes.system \
-                and self.parsed.attributes.hidden \
-                and self.parsed.attributes.readonly
+        return self._is_lfn
 
     def is_dir(self) -> bool:
         """
@@ -167,18 +211,15 @@ class DirEntry(object):
         # if this is a lfn entry
         if self.is_lfn():
             lfnpart = self.parsed.name1 + self.parsed.name2 + self.parsed.name3
-            # end of string is indicated by \x00\x00
-            # following procedure looks for this sequence and removes
-            # non-chars after padding
-            retlfn = b''
-            for i in range(int(len(lfnpart) / 2)):
-                i *= 2
-                next_bytes = lfnpart[i:i+2]
-                if next_bytes != b'\x00\x00':
-                    retlfn += next_bytes
-                else:
-                    break
-            return retlfn.decode('utf-16')
+            # end of string is indicated by \x00\x00; cut at the first
+            # occurrence that sits on a character boundary, everything
+            # after it is padding
+            term = lfnpart.find(b'\x00\x00')
+            while term != -1 and term % 2:
+                term = lfnpart.find(b'\x00\x00', term + 1)
+            if term != -1:
+                lfnpart = lfnpart[:term]
+            return lfnpart.decode('utf-16-le')
         else:
             # if this is a regular directory entry
             if self.lfn_name:
@@ -197,10 +238,11 @@ class DirEntry(object):
         :return: int, start cluster_id of this directory entry
         """
         if not self.is_fat32:
-            return int.from_bytes(self.parsed.firstCluster, byteorder='little')
-        start_cluster_bytes = self.parsed.firstCluster \
-                                + self.parsed.accessRightsBitmap
-        return int.from_bytes(start_cluster_bytes, byteorder='little')
+            return self.parsed.firstCluster
+        # on FAT32 the accessRightsBitmap field holds the high word of
+        # the cluster number
+        return (self.parsed.accessRightsBitmap << 16) \
+            | self.parsed.firstCluster
 
     def get_filesize(self) -> int:
         """
@@ -3,10 +3,15 @@ Abstract base class for FAT12, FAT16 and FAT32 reader
 """
 
 import logging
+import mmap
+import os
+import queue
+import threading
 import typing as typ
 from abc import ABCMeta, abstractmethod
-from io import BytesIO, BufferedReader
-from construct import Struct, Array, Bytes
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from io import BytesIO, UnsupportedOperation
+from construct import Struct
 from .dir_entry import DirEntry, LFNEntries
 
 
@@ -26,23 +31,113 @@ class FAT:  # pylint: disable=too-many-instance-attributes
     Abstract base class of all FAT filesystem types.
     """
     __metaclass__ = ABCMeta
-    def __init__(self, stream: typ.BinaryIO, predataregion: Struct):
+    def __init__(self, stream: typ.BinaryIO, bootsector: Struct):
         """
         :param stream: filedescriptor of a FAT filesystem
-        :param predataregion: Struct that represents the PreDataRegion
-                              of the concrete FAT filesystem
+        :param bootsector: Struct that represents the bootsector of the
+                           concrete FAT filesystem
         """
         self.stream = stream
         self.offset = stream.tell()
-        self.predataregion_definition = predataregion
-        self.pre = predataregion.parse_stream(stream)
-        self.start_dataregion = stream.tell()
+        self.bootsector_definition = bootsector
+        self.pre = bootsector.parse_stream(stream)
+        # layout of the pre data region, computed from the bootsector
+        # geometry instead of parsing the whole region with construct,
+        # so FATs and root directory are not copied into memory at
+        # open time
+        self._fat_size = self.pre.sectors_per_fat * self.pre.sector_size
+        self._fat0_start = self.offset + self.pre.reserved_sector_count \
+            * self.pre.sector_size
+        self._rootdir_start = self._fat0_start \
+            + self.pre.fat_count * self._fat_size
+        self._rootdir_size = self.pre.rootdir_entry_count * 32
+        self.start_dataregion = self._rootdir_start + self._rootdir_size
+        # hoisted cluster geometry; get_cluster_start is called once per
+        # cluster on every read path, so precompute the two scalars it
+        # needs instead of chasing construct Container attributes per call
+        self._cluster_size = self.pre.sectors_per_cluster \
+            * self.pre.sector_size
+        self._dataregion_base = self.start_dataregion - 2 * self._cluster_size
         self._fat_entry = None
         self.entries_per_fat = None
         self.fat_type = None
+        # cache for already followed cluster chains, keyed by start
+        # cluster. Cleared whenever a FAT entry is rewritten
+        self._chain_cache = {}
+        # cache for already resolved filepaths, keyed by path prefix.
+        # Cleared whenever a FAT entry is rewritten
+        self._path_cache = {}
+        # keep the file descriptor for positional reads; streams without
+        # one (e.g. BytesIO) fall back to seek+read on the stream
+        try:
+            self._fd = stream.fileno()
+        except (AttributeError, OSError, UnsupportedOperation):
+            self._fd = None
+        # map the device read-only, so that FAT lookups become zero-copy
+        # slices into the page cache instead of slicing python bytes
+        # objects. Streams without a file descriptor (e.g. BytesIO) fall
+        # back to a view over a plain read of the first FAT
+        try:
+            self._mm = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            self._fat0 = memoryview(self._mm)[
+                self._fat0_start:self._fat0_start+self._fat_size]
+        except (OSError, ValueError, UnsupportedOperation):
+            self._mm = None
+            self._refresh_fat_view()
+
+    def _refresh_fat_view(self) -> None:
+        """
+        re-read the first FAT from the stream
+
+        only needed if the device is not memory mapped; a mapped FAT
+        sees writes through self.stream without re-reading
+        """
+        if self._mm is None:
+            self._fat0 = memoryview(self._read_at(self._fat0_start,
+                                                  self._fat_size))
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        """
+        reads a byte range from the filesystem without touching the
+        shared stream position
+
+        a positional os.pread combines the seek+read pair into one
+        syscall and keeps concurrent readers safe, as it does not go
+        through the file position. Streams without a file descriptor
+        fall back to seek+read
+
+        :param offset: int, absolute offset to read from
+        :param length: int, number of bytes to read
+        :return: bytes, may be shorter than length at end of stream
+        """
+        if self._fd is None:
+            self.stream.seek(offset)
+            return self.stream.read(length)
+        # pread bypasses the stream buffer, so pending buffered writes
+        # have to reach the descriptor first (a no-op on read-only
+        # streams)
+        self.stream.flush()
+        buffer = os.pread(self._fd, length, offset)
+        while len(buffer) < length:
+            chunk = os.pread(self._fd, length - len(buffer),
+                             offset + len(buffer))
+            if not chunk:
+                break
+            buffer += chunk
+        return buffer
 
     @abstractmethod
-    def get_cluster_value(self, cluster_id: int) -> int:
+    def _get_raw_cluster_value(self, cluster_id: int) -> int:
+        """
+        reads the raw integer value that is written into fat
+        for given cluster_id
+
+        :param cluster_id: int, cluster that will be looked up
+        :return: int
+        """
+        raise NotImplementedError()
+
+    def get_cluster_value(self, cluster_id: int) -> typ.Union[int, str]:
         """
         finds the value that is written into fat
         for given cluster_id
@@ -50,7 +145,8 @@ class FAT:  # pylint: disable=too-many-instance-attributes
         :param cluster_id: int, cluster that will be looked up
         :return: int or string
         """
-        raise NotImplementedError()
+        value = self._get_raw_cluster_value(cluster_id)
+        return self._fat_entry.decoding.get(value, value)
 
     def write_fat_entry(self, cluster_id: int,
                         value: typ.Union[int, str]) -> None:
@@ -80,28 +176,21 @@ class FAT:  # pylint: disable=too-many-instance-attributes
                             + "bad_cluster use 'bad_cluster'"
             assert value >= 2, "next_cluster value must be >= 2. For " \
                                + "free_cluster use 'free_cluster'"
-        # get start position of FAT0
-        fat0_start = self.offset + 512 + (self.pre.sector_size - 512) + \
-            (self.pre.reserved_sector_count - 1) * self.pre.sector_size
-        fat1_start = fat0_start + self.pre.sectors_per_fat \
-            * self.pre.sector_size
         # update first fat on disk
-        self.stream.seek(fat0_start + cluster_id
+        self.stream.seek(self._fat0_start + cluster_id
                          * self._fat_entry.sizeof())
         self.stream.write(self._fat_entry.build(value))
         # update second fat on disk if it exists
         if self.pre.fat_count > 1:
-            self.stream.seek(fat1_start + cluster_id
+            self.stream.seek(self._fat0_start + self._fat_size + cluster_id
                              * self._fat_entry.sizeof())
             self.stream.write(self._fat_entry.build(value))
         # flush changes to disk
         self.stream.flush()
-        # re-read fats into memory
-        fat_definition = Array(self.pre.fat_count,
-                               Bytes(self.pre.sectors_per_fat *
-                                     self.pre.sector_size))
-        self.stream.seek(fat0_start)
-        self.pre.fats = fat_definition.parse_stream(self.stream)
+        self._refresh_fat_view()
+        # cached chains and resolved paths may contain the old value
+        self._chain_cache.clear()
+        self._path_cache.clear()
 
     def get_free_cluster(self) -> int:
         """
@@ -130,7 +219,8 @@ class FAT:  # pylint: disable=too-many-instance-attributes
                 current_id += 1
                 continue
             # check if current_id is free. Return if it is
-            if self.get_cluster_value(current_id) == 'free_cluster':
+            if self._get_raw_cluster_value(current_id) \
+                    == self._fat_entry.encoding['free_cluster']:
                 return current_id
             # If current_id is not allocated, increment it and wrap
             # around the maximum count of entries as with FAT32 we
@@ -146,20 +236,46 @@ class FAT:  # pylint: disable=too-many-instance-attributes
         :param start_cluster: cluster to start with
         :return: list of cluster numbers (int)
         """
-        clusters = [start_cluster]
+        cached = self._chain_cache.get(start_cluster)
+        if cached is not None:
+            # hand out a fresh list, callers may modify it
+            return list(cached)
+        get_raw_value = self._get_raw_cluster_value
+        # compare raw integer values against the sentinel ranges of the
+        # concrete FAT type instead of mapping every hop to its string
+        # representation first
+        free = self._fat_entry.encoding['free_cluster']
+        bad = self._fat_entry.encoding['bad_cluster']
+        eoc_max = self._fat_entry.encoding['last_cluster']
+        current = start_cluster
+        clusters = [current]
+        # a corrupt FAT can contain chain cycles, which would otherwise
+        # spin forever while growing the cluster list unboundedly; track
+        # the visited clusters and fail fast instead
+        seen = {current}
+        entries_per_fat = self.entries_per_fat
         while True:
-            next_cluster_id = clusters[-1]
-            next_cluster = self.get_cluster_value(next_cluster_id)
-            if next_cluster == 'last_cluster':
+            next_cluster = get_raw_value(current)
+            if next_cluster == 1 or bad < next_cluster <= eoc_max:
+                # the cache holds tuples, so cached chains cannot be
+                # mutated through the returned lists
+                self._chain_cache[start_cluster] = tuple(clusters)
                 return clusters
-            elif next_cluster == 'free_cluster':
+            elif next_cluster == free:
                 raise Exception("Cluster %d is a free cluster"
-                                % next_cluster_id)
-            elif next_cluster == 'bad_cluster':
+                                % current)
+            elif next_cluster == bad:
                 raise Exception("Cluster %d is a bad cluster"
-                                % next_cluster_id)
+                                % current)
             else:
+                if next_cluster in seen \
+                        or len(clusters) >= entries_per_fat:
+                    raise Exception("Cluster chain starting at %d does not"
+                                    " terminate (cycle or corrupt FAT)"
+                                    % start_cluster)
+                seen.add(next_cluster)
                 clusters.append(next_cluster)
+                current = next_cluster
 
     def get_cluster_start(self, cluster_id: int) -> int:
         """
@@ -168,23 +284,37 @@ class FAT:  # pylint: disable=too-many-instance-attributes
         :param cluster_id: id of the cluster
         :return: int, start byte of the given cluster_id
         """
-        # offset of requested cluster to the start of dataregion in bytes
-        cluster_offset = (cluster_id - 2) \
-            * self.pre.sectors_per_cluster \
-            * self.pre.sector_size
-        # offset of requested cluster to the start of the stream
-        cluster_start = self.start_dataregion + cluster_offset
-        return cluster_start
+        # _dataregion_base already accounts for cluster numbering
+        # starting at 2
+        return self._dataregion_base + cluster_id * self._cluster_size
 
     def file_to_stream(self, start_cluster_id: int,
                        stream: typ.BinaryIO) -> None:
         """
         writes all clusters of a file into a given stream
+
+        adjacent clusters of the chain are coalesced into single bulk
+        reads, so an unfragmented file (the common case, e.g. FAT32
+        directories) is read with one seek+read instead of one per
+        cluster
         :param start_cluster_id: int, cluster_id of the start cluster
         :param stream: stream, the file will written into
         """
+        cluster_size = self._cluster_size
+        run_start = None
+        run_length = 0
         for cluster_id in self.follow_cluster(start_cluster_id):
-            self.cluster_to_stream(cluster_id, stream)
+            if run_start is not None \
+                    and cluster_id == run_start + run_length:
+                # cluster continues the current contiguous run
+                run_length += 1
+            else:
+                if run_start is not None:
+                    self.cluster_to_stream(run_start, stream,
+                                           run_length * cluster_size)
+                run_start = cluster_id
+                run_length = 1
+        self.cluster_to_stream(run_start, stream, run_length * cluster_size)
 
     def cluster_to_stream(self, cluster_id: int, stream: typ.BinaryIO,
                           length: int = None) -> None:
@@ -198,18 +328,15 @@ class FAT:  # pylint: disable=too-many-instance-attributes
                        Default: cluster size
         """
         if length is None:
-            length = self.pre.sectors_per_cluster * self.pre.sector_size
+            length = self._cluster_size
         start = self.get_cluster_start(cluster_id)
 
-        self.stream.seek(start)
-        while length > 0:
-            read = self.stream.read(length)
-            if not read:
-                LOGGER.warning("failed to read %s bytes at %s",
-                               length, self.stream.tell())
-                raise EOFError()
-            length -= len(read)
-            stream.write(read)
+        buffer = self._read_at(start, length)
+        if len(buffer) < length:
+            LOGGER.warning("failed to read %s bytes at %s",
+                           length - len(buffer), start + len(buffer))
+            raise EOFError()
+        stream.write(buffer)
 
     @abstractmethod
     def _root_to_stream(self, stream: typ.BinaryIO) -> None:
@@ -261,47 +388,57 @@ class FAT:  # pylint: disable=too-many-instance-attributes
             else:
                 # if cluster_id is != 0, write cluster into stream
                 self.file_to_stream(cluster_id, mem)
-            mem.seek(0)
-            with BufferedReader(mem) as reader:
-                while reader.peek(1):
-                    # read 32 bit into variable
-                    raw = reader.read(32)
-                    # stop if we read less than 32 byte
-                    if len(raw) < 32:
-                        raise StopIteration()
-                    # parse as DirEntry
-                    dir_entry = DirEntry(raw, self.fat_type)
-                    # If dir entry is completely empty, skip it
-                    if dir_entry.is_empty():
-                        continue
-                    # If it is a lfn entry, store it for later assignment to
-                    # its physical entry
-                    if dir_entry.is_lfn():
-                        lfn_entries.append(dir_entry)
-                    else:
-                        dir_entry.lfn_name = lfn_entries.get_name()
-                        lfn_entries.clear()
-                        yield dir_entry
+            buf = mem.getvalue()
+        # iterate the directory as 32 byte slices of a single buffer,
+        # a trailing partial entry is ignored
+        empty_entry = b'\x00' * 32
+        for offset in range(0, len(buf) - len(buf) % 32, 32):
+            entry_bytes = buf[offset:offset+32]
+            # If dir entry is completely empty, skip it without
+            # allocating a DirEntry for it
+            if entry_bytes == empty_entry:
+                continue
+            # parse as DirEntry
+            dir_entry = DirEntry(entry_bytes, self.fat_type)
+            # If it is a lfn entry, store it for later assignment to
+            # its physical entry
+            if dir_entry.is_lfn():
+                lfn_entries.append(dir_entry)
+            else:
+                dir_entry.lfn_name = lfn_entries.get_name()
+                lfn_entries.clear()
+                yield dir_entry
 
     def find_file(self, filepath: str) -> DirEntry:
         """
         returns the directory entry for a given filepath
 
+        every resolved path prefix is cached, so batches of lookups that
+        share common parent directories (e.g. multiple destinations
+        below the same directory) do not re-read the same directories
+        over and over. The cache is invalidated whenever the FAT is
+        written to
+
         :param filepath: string, filepath to the file
         :return: DirEntry of the requested file
         """
-        # build up filepath as directory and
-        # reverse it so, that we can simple
-        # pop all filepath parts from it
         path = filepath.split('/')
-        path = list(reversed(path))
-        # read root directory and append all file entries
-        current_directory = []
-        for entry in self.get_root_dir_entries():
-            current_directory.append(entry)  # pylint: disable=bad-whitespace
-
-        while path:
-            fpart = path.pop()
+        entry = None
+        current_directory = None
+        for depth, fpart in enumerate(path):
+            prefix = '/'.join(path[:depth + 1])
+            cached = self._path_cache.get(prefix)
+            if cached is not None:
+                entry = cached
+                current_directory = None
+                continue
+            if current_directory is None:
+                # read the directory the resolution currently points to
+                if entry is None:
+                    current_directory = list(self.get_root_dir_entries())
+                else:
+                    current_directory = list(
+                        self.get_dir_entries(entry.get_start_cluster()))
 
             # scan current directory for filename
             filename_found = False
@@ -313,10 +450,130 @@ class FAT:  # pylint: disable=too-many-instance-attributes
                     break
             if not filename_found:
                 raise Exception("File or directory '%s' not found" % fpart)
+            self._path_cache[prefix] = entry
 
             # if it is a subdirectory and not the last name, enter it
-            if entry.is_dir() and path:
-                current_directory.clear()
-                for entry in self.get_dir_entries(entry.get_start_cluster()):
-                    current_directory.append(entry)  # pylint: disable=bad-whitespace
+            if entry.is_dir() and depth + 1 < len(path):
+                current_directory = None
         return entry
+
+    def _read_dir(self, cluster_id: int) -> typ.List[DirEntry]:
+        """
+        read one directory into a list of entries
+
+        :param cluster_id: int, cluster to parse,
+                           if cluster_id == 0, parse rootdir
+        :return: list of DirEntry
+        """
+        if cluster_id == 0:
+            return list(self.get_root_dir_entries())
+        return list(self.get_dir_entries(cluster_id))
+
+    @staticmethod
+    def _collect_subdirs(path: str, entries: typ.List[DirEntry],
+                         visited: typ.Set[int]) \
+            -> typ.List[typ.Tuple[str, int]]:
+        """
+        collect the subdirectories of a parsed directory that were not
+        visited yet
+
+        :param path: str, path of the parsed directory
+        :param entries: list of DirEntry of the parsed directory
+        :param visited: set of already seen cluster ids, guards against
+                        cycles in corrupted filesystems
+        :return: list of (path, cluster_id) tuples
+        """
+        subdirs = []
+        for entry in entries:
+            if entry.is_deleted() or not entry.is_dir() \
+                    or entry.is_dot_entry():
+                continue
+            cluster_id = entry.get_start_cluster()
+            if cluster_id not in visited:
+                visited.add(cluster_id)
+                subdirs.append((path + entry.get_name() + '/', cluster_id))
+        return subdirs
+
+    def walk_parallel(self, root_cluster_id: int = 0, max_workers: int = 8) \
+            -> typ.Dict[str, typ.List[DirEntry]]:
+        """
+        reads the whole directory tree below a given cluster
+
+        directories are parsed concurrently by a small thread pool, so
+        reads of disjoint cluster chains overlap their device latency
+        instead of waiting on one another. Every worker parses through
+        its own filesystem instance to keep stream positions isolated;
+        streams that are not backed by a file on disk fall back to a
+        sequential walk
+
+        :param root_cluster_id: int, cluster to start with,
+                                if 0 start at the root directory
+        :param max_workers: int, number of reader threads
+        :return: dict, mapping the path of every directory to the list
+                 of its entries
+        """
+        try:
+            self.stream.fileno()
+            fs_path = self.stream.name
+        except (AttributeError, OSError, UnsupportedOperation):
+            fs_path = None
+        if fs_path is None:
+            return self._walk_sequential(root_cluster_id)
+        # one filesystem instance per worker, handed out through a
+        # queue, so the seek position of a stream is never contended
+        streams = []
+        spares = queue.Queue()
+        for _ in range(max_workers):
+            stream = open(fs_path, 'rb')
+            stream.seek(self.offset)
+            streams.append(stream)
+            spares.put(type(self)(stream))
+        visited = {root_cluster_id}
+        entries_by_path = {}
+        lock = threading.Lock()
+
+        def scan(path: str, cluster_id: int) \
+                -> typ.List[typ.Tuple[str, int]]:
+            fatfs = spares.get()
+            try:
+                entries = fatfs._read_dir(cluster_id)  # pylint: disable=protected-access
+            finally:
+                spares.put(fatfs)
+            with lock:
+                entries_by_path[path] = entries
+                return self._collect_subdirs(path, entries, visited)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                pending = {pool.submit(scan, '/', root_cluster_id)}
+                while pending:
+                    done, pending = wait(pending,
+                                         return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for path, cluster_id in future.result():
+                            pending.add(pool.submit(scan, path, cluster_id))
+        finally:
+            for stream in streams:
+                stream.close()
+        return entries_by_path
+
+    def _walk_sequential(self, root_cluster_id: int) \
+            -> typ.Dict[str, typ.List[DirEntry]]:
+        """
+        sequential fallback of walk_parallel for filesystems that are
+        not backed by a file on disk
+
+        :param root_cluster_id: int, cluster to start with,
+                                if 0 start at the root directory
+        :return: dict, mapping the path of every directory to the list
+                 of its entries
+        """
+        visited = {root_cluster_id}
+        entries_by_path = {}
+        stack = [('/', root_cluster_id)]
+        while stack:
+            path, cluster_id = stack.pop()
+            entries = self._read_dir(cluster_id)
+            entries_by_path[path] = entries
+            stack.extend(self._collect_subdirs(path, entries, visited))
+        return entries_by_path
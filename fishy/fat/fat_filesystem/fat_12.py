@@ -27,6 +27,8 @@ from .fat import FAT
 from .fat_entry import FAT12Entry
 
 
+# layout documentation; no longer parsed as a whole, the FAT12 class
+# only parses the bootsector and reads FATs/rootdir on demand
 FAT12_PRE_DATA_REGION = Struct(
     "bootsector" / Embedded(FAT12_16_BOOTSECTOR),
     Padding((this.reserved_sector_count - 1) * this.sector_size),
@@ -37,6 +39,31 @@ FAT12_PRE_DATA_REGION = Struct(
     )
 
 
+def _decode_fat12(buf: typ.Union[bytes, memoryview]) -> typ.List[int]:
+    """
+    decodes a raw FAT12 file allocation table into a list of
+    12 bit cluster values
+
+    every three bytes of the FAT hold two 12 bit entries; because of
+    little endianess the even entry consists of the first byte plus the
+    low nibble of the second byte, the odd entry of the high nibble of
+    the second byte plus the third byte
+
+    :param buf: bytes, raw content of one file allocation table
+    :return: list of int, decoded 12 bit cluster values
+    """
+    values = []
+    full_pairs = len(buf) - len(buf) % 3
+    for offset in range(0, full_pairs, 3):
+        low, mid, high = buf[offset], buf[offset+1], buf[offset+2]
+        values.append(low | ((mid & 0x0f) << 8))
+        values.append((mid >> 4) | (high << 4))
+    if len(buf) % 3 == 2:
+        # a trailing even entry without its odd counterpart
+        values.append(buf[-2] | ((buf[-1] & 0x0f) << 8))
+    return values
+
+
 class FAT12(FAT):
     """
     FAT12 filesystem implementation.
@@ -45,44 +72,24 @@ class FAT12(FAT):
         """
         :param stream: filedescriptor of a FAT12 filesystem
         """
-        super().__init__(stream, FAT12_PRE_DATA_REGION)
+        super().__init__(stream, FAT12_16_BOOTSECTOR)
         self.entries_per_fat = int(self.pre.sectors_per_fat
                                    * self.pre.sector_size
                                    * 8 / 12)
         self._fat_entry = FAT12Entry
         self.fat_type = 'FAT12'
+        # decode the whole FAT once, so that cluster lookups become
+        # simple list indexing instead of per-call nibble extraction
+        self._fat_entries = _decode_fat12(self._fat0)
 
-    def get_cluster_value(self, cluster_id: int) -> typ.Union[int, str]:
+    def _get_raw_cluster_value(self, cluster_id: int) -> int:
         """
-        finds the value that is written into fat
+        reads the raw integer value that is written into fat
         for given cluster_id
         :param cluster_id: int, cluster that will be looked up
-        :return: int or string
+        :return: int
         """
-        # as python read does not allow to read simply 12 bit,
-        # we need to do some fancy stuff to extract those from
-        # 16 bit long reads
-        # this strange layout results from the little endianess
-        # which causes that:
-        # * clusternumbers beginning at the start of a byte use this
-        #   byte + the second nibble of the following byte.
-        # * clusternumbers beginning in the middle of a byte use
-        #   the first nibble of this byte + the second byte
-        # because of little endianess these nibbles need to be
-        # reordered as by default int() interpretes hexstrings as
-        # big endian
-        #
-        byte = cluster_id + int(cluster_id/2)
-        byte_slice = self.pre.fats[0][byte:byte+2]
-        if cluster_id % 2 == 0:
-            # if cluster_number is even, we need to wipe the third nibble
-            hexvalue = byte_slice.hex()
-            value = int(hexvalue[3] + hexvalue[0:2], 16)
-        else:
-            # if cluster_number is odd, we need to wipe the second nibble
-            hexvalue = byte_slice.hex()
-            value = int(hexvalue[2:4] + hexvalue[0], 16)
-        return self._fat_entry.parse(value.to_bytes(2, 'little'))
+        return self._fat_entries[cluster_id]
 
     def write_fat_entry(self, cluster_id: int,
                         value: typ.Union[int, str]) -> None:
@@ -96,46 +103,43 @@ class FAT12(FAT):
                                   + "bad_cluster use 'bad_cluster'"
             assert value >= 2, "next_cluster value must be >= 2. For " \
                                + "free_cluster use 'free_cluster'"
-        # get start position of FAT0
-        fat0_start = self.offset + 512 + (self.pre.sector_size - 512) + \
-            (self.pre.reserved_sector_count - 1) * self.pre.sector_size
-        fat1_start = fat0_start + self.pre.sectors_per_fat \
-            * self.pre.sector_size
         # read current entry
         byte = cluster_id + int(cluster_id/2)
-        self.stream.seek(fat0_start + byte)
-        current_entry = self.stream.read(2).hex()
-        new_entry_hex = self._fat_entry.build(value).hex()
-        # calculate new entry as next entry overlaps with current bytes
+        self.stream.seek(self._fat0_start + byte)
+        current_entry = self.stream.read(2)
+        raw = int.from_bytes(self._fat_entry.build(value), 'little')
+        # merge the new 12 bit value with the neighbouring entry that
+        # shares a byte with it, using integer arithmetic instead of
+        # roundtripping through hex strings
         if cluster_id % 2 == 0:
-            # if cluster_number is even, we need to keep the third nibble
-            new_entry = new_entry_hex[0:2] + current_entry[2] \
-                + new_entry_hex[3]
+            # if cluster_number is even, we need to keep the high nibble
+            # of the shared byte
+            new_entry = bytes((raw & 0xff,
+                               (current_entry[1] & 0xf0) | (raw >> 8)))
         else:
-            # if cluster_number is odd, we need to keep the second nibble
-            new_entry = new_entry_hex[1] + current_entry[1] + \
-                    new_entry_hex[3] + new_entry_hex[0]
-        # convert hex to bytes
-        new_entry = bytes.fromhex(new_entry)
+            # if cluster_number is odd, we need to keep the low nibble
+            # of the shared byte
+            new_entry = bytes(((current_entry[0] & 0x0f)
+                               | ((raw & 0x0f) << 4),
+                               raw >> 4))
         # write new value to first fat on disk
-        self.stream.seek(fat0_start + byte)
+        self.stream.seek(self._fat0_start + byte)
         self.stream.write(new_entry)
         # write new value to second fat on disk if it exists
         if self.pre.fat_count > 1:
-            self.stream.seek(fat1_start + byte)
+            self.stream.seek(self._fat0_start + self._fat_size + byte)
             self.stream.write(new_entry)
         # flush changes to disk
         self.stream.flush()
-        # re-read fats into memory
-        fat_definition = Array(self.pre.fat_count,
-                               Bytes(self.pre.sectors_per_fat *
-                                     self.pre.sector_size))
-        self.stream.seek(fat0_start)
-        self.pre.fats = fat_definition.parse_stream(self.stream)
+        self._refresh_fat_view()
+        self._fat_entries = _decode_fat12(self._fat0)
+        # cached chains and resolved paths may contain the old value
+        self._chain_cache.clear()
+        self._path_cache.clear()
 
     def _root_to_stream(self, stream: typ.BinaryIO) -> None:
         """
         write root directory into a given stream
         :param stream: stream, where the root directory will be written into
         """
-        stream.write(self.pre.rootdir)
+        stream.write(self._read_at(self._rootdir_start, self._rootdir_size))
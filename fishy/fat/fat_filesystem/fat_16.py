@@ -19,6 +19,7 @@ example to print all root directory entries
 >>>         print(v, entry.get_start_cluster())
 
 """
+import struct
 import typing as typ
 from construct import Struct, Array, Padding, Embedded, Bytes, this
 from .bootsector import FAT12_16_BOOTSECTOR
@@ -27,6 +28,8 @@ from .fat import FAT
 from .fat_entry import FAT16Entry
 
 
+# layout documentation; no longer parsed as a whole, the FAT16 class
+# only parses the bootsector and reads FATs/rootdir on demand
 FAT16_PRE_DATA_REGION = Struct(
     "bootsector" / Embedded(FAT12_16_BOOTSECTOR),
     Padding((this.reserved_sector_count - 1) * this.sector_size),
@@ -36,6 +39,9 @@ FAT16_PRE_DATA_REGION = Struct(
     "rootdir" / Bytes(this.rootdir_entry_count * DIR_ENTRY.sizeof())
     )
 
+# precompiled reader for one 16 bit FAT entry
+_FAT16_ENTRY = struct.Struct('<H')
+
 
 class FAT16(FAT):
     """
@@ -45,28 +51,27 @@ class FAT16(FAT):
         """
         :param stream: filedescriptor of a FAT16 filesystem
         """
-        super().__init__(stream, FAT16_PRE_DATA_REGION)
+        super().__init__(stream, FAT12_16_BOOTSECTOR)
         self.entries_per_fat = int(self.pre.sectors_per_fat
                                    * self.pre.sector_size
                                    / 2)
         self._fat_entry = FAT16Entry
         self.fat_type = 'FAT16'
 
-    def get_cluster_value(self, cluster_id: int) -> typ.Union[int, str]:
+    def _get_raw_cluster_value(self, cluster_id: int) -> int:
         """
-        finds the value that is written into fat
+        reads the raw integer value that is written into fat
         for given cluster_id
         :param cluster_id: int, cluster that will be looked up
-        :return: int or string
+        :return: int
         """
-        byte = cluster_id*2
-        byte_slice = self.pre.fats[0][byte:byte+2]
-        value = int.from_bytes(byte_slice, byteorder='little')
-        return self._fat_entry.parse(value.to_bytes(2, 'little'))
+        # unpack_from reads straight out of the FAT view, without an
+        # intermediate slice
+        return _FAT16_ENTRY.unpack_from(self._fat0, cluster_id * 2)[0]
 
     def _root_to_stream(self, stream: typ.BinaryIO) -> None:
         """
         write root directory into a given stream
         :param stream: stream, where the root directory will be written into
         """
-        stream.write(self.pre.rootdir)
+        stream.write(self._read_at(self._rootdir_start, self._rootdir_size))
@@ -19,6 +19,7 @@ example to print all root directory entries
 >>>         print(entry.get_start_cluster())
 
 """
+import struct
 import typing as typ
 from construct import Struct, Array, Padding, Embedded, Bytes, this
 from .bootsector import FAT32_BOOTSECTOR, FAT_CORE_BOOTSECTOR, \
@@ -27,6 +28,8 @@ from .fat import FAT
 from .fat_entry import FAT32Entry
 
 
+# layout documentation; no longer parsed as a whole, the FAT32 class
+# only parses the bootsector and reads the FATs on demand
 FAT32_PRE_DATA_REGION = Struct(
     "bootsector" / Embedded(FAT32_BOOTSECTOR),
     Padding((this.reserved_sector_count - 2) * this.sector_size),
@@ -34,6 +37,9 @@ FAT32_PRE_DATA_REGION = Struct(
     "fats" / Array(this.fat_count, Bytes(this.sectors_per_fat * this.sector_size)),
     )
 
+# precompiled reader for one 32 bit FAT entry
+_FAT32_ENTRY = struct.Struct('<I')
+
 
 class FAT32(FAT):
     """
@@ -43,27 +49,27 @@ class FAT32(FAT):
         """
         :param stream: filedescriptor of a FAT32 filesystem
         """
-        super().__init__(stream, FAT32_PRE_DATA_REGION)
+        super().__init__(stream, FAT32_BOOTSECTOR)
         self.entries_per_fat = int(self.pre.sectors_per_fat
                                    * self.pre.sector_size
                                    / 4)
         self._fat_entry = FAT32Entry
         self.fat_type = 'FAT32'
 
-    def get_cluster_value(self, cluster_id: int) -> typ.Union[int, str]:
+    def _get_raw_cluster_value(self, cluster_id: int) -> int:
         """
-        finds the value that is written into fat
+        reads the raw integer value that is written into fat
         for given cluster_id
         :param cluster_id: int, cluster that will be looked up
-        :return: int or string
+        :return: int
         """
-        byte = cluster_id*4
+        # unpack_from reads straight out of the FAT view, without an
+        # intermediate slice
         # TODO: Use active FAT
-        byte_slice = self.pre.fats[0][byte:byte+4]
-        value = int.from_bytes(byte_slice, byteorder='little')
-        # TODO: Remove highest 4 Bits as FAT32 uses only 28Bit
-        #       long addresses.
-        return self._fat_entry.parse(value.to_bytes(4, 'little'))
+        # FAT32 uses only 28 bit long addresses, the highest 4 bits are
+        # reserved and have to be masked off
+        return _FAT32_ENTRY.unpack_from(self._fat0, cluster_id * 4)[0] \
+            & 0x0fffffff
 
     def _root_to_stream(self, stream: typ.BinaryIO) -> None:
         """
@@ -90,9 +96,9 @@ class FAT32(FAT):
         # write new value to disk
         self.stream.seek(self.offset + fs_info_start + free_cluster_offset)
         self.stream.write(int(new_value).to_bytes(4, 'little'))
-        # re-read pre_data_region
+        # re-read bootsector
         self.stream.seek(self.offset)
-        self.pre = FAT32_PRE_DATA_REGION.parse_stream(self.stream)
+        self.pre = FAT32_BOOTSECTOR.parse_stream(self.stream)
 
     def write_last_allocated(self, new_value: int) -> None:
         """
@@ -109,6 +115,6 @@ class FAT32(FAT):
         # write new value to disk
         self.stream.seek(self.offset + fs_info_start + free_cluster_offset)
         self.stream.write(int(new_value).to_bytes(4, 'little'))
-        # re-read pre_data_region
+        # re-read bootsector
         self.stream.seek(self.offset)
-        self.pre = FAT32_PRE_DATA_REGION.parse_stream(self.stream)
+        self.pre = FAT32_BOOTSECTOR.parse_stream(self.stream)
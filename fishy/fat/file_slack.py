@@ -177,7 +177,10 @@ class FileSlack:
         """
         metadata = FileSlackMetadata()
         next_file = self._get_writable_file(filepaths)
-        while instream.peek():
+        # the loop is driven by the lengths that _write_to_slack reads,
+        # not by peeking at the stream; peek forces a buffered read per
+        # iteration and only reports what happens to sit in the buffer
+        while True:
             entry = next(next_file)
             if entry is None:
                 # dont do anything, if we dont have files anymore
@@ -189,13 +192,17 @@ class FileSlack:
             written_bytes, cluster_id = self._write_to_slack(instream, entry)
             LOGGER.info("%d bytes written into cluster %d",
                         written_bytes, cluster_id)
-            metadata.add_cluster(cluster_id, occupied + ram_slack,
-                                 written_bytes)
-
-        if instream.peek():
+            if written_bytes > 0:
+                metadata.add_cluster(cluster_id, occupied + ram_slack,
+                                     written_bytes)
+            if written_bytes < free_slack:
+                # short read, the instream is exhausted
+                return metadata
+
+        if instream.read(1):
             self.clear(metadata)
-            raise IOError("No slack space left, to write data. But there are"
-                          + " still %d Bytes in stream" % len(instream.peek()))
+            raise IOError("No slack space left, to write data. But there is"
+                          + " still data in stream")
         return metadata
 
     def _write_to_slack(self, instream: typ.BinaryIO, entry: DirEntry) \